@@ -13,10 +13,13 @@ from tm_data_types.datum.waveforms.waveform import Waveform, WaveformMetaInfo
 from tm_data_types.helpers.class_lookup import FileExtensions
 from tm_data_types.helpers.enums import SIBaseUnit
 from tm_data_types.io_factory_methods import (
+    iread_files_in_parallel,
     read_file,
     read_files_in_parallel,
     write_file,
     write_files_in_parallel,
+    write_same_file,
+    write_same_file_in_parallel,
 )
 
 # Read version from installed package.
@@ -35,8 +38,11 @@ __all__ = [
     "SIBaseUnit",
     "Waveform",
     "WaveformMetaInfo",
+    "iread_files_in_parallel",
     "read_file",
     "read_files_in_parallel",
     "write_file",
     "write_files_in_parallel",
+    "write_same_file",
+    "write_same_file_in_parallel",
 ]
@@ -3,9 +3,11 @@
 """A class which hosts a readable representation of the format information in a .wfm file."""
 
 import contextlib
+import io
 import struct
 
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import (
     Callable,
     Dict,
@@ -75,6 +77,9 @@ T2 = TypeVar("T2")  # pylint: disable=invalid-name
 class Dimension(Generic[T1, T2]):
     """A feature that has two dimensions, used within wfm formatting."""
 
+    # slotted by hand, as dataclass(slots=True) is not available in every supported python version
+    __slots__ = ("first", "second")
+
     ################################################################################################
     # Class Variables
     ################################################################################################
@@ -104,20 +109,59 @@ class Dimension(Generic[T1, T2]):
 
 
 @njit(cache=True)
-def calculate_checksum(value) -> int:
+def calculate_checksum(value) -> np.uint64:
     """Calculate the byte checksum for the np arrays using numba.
 
+    The first call in a fresh environment pays the JIT compilation cost, after which the compiled
+    kernel is loaded from the on-disk cache. Because of that, this should only be used on large
+    curve buffers where the compiled summation outweighs the dispatch overhead.
+
+    The kernel is serial on purpose. A numba threading pool started here is not safe to fork, and
+    the parallel methods fork processes which checksum their own curves.
+
     Returns:
         The summation of all byte values in the numpy array
     """
-    # this is the fastest possible summation of an np array
-    # we view the buffer contents in a byte format. add reduce is called to
-    # reduce its summation overhead and is used with an expectant uint64 output,
-    # allowing for the uint8s to be summed
-    # without the extra bits needed for each value. Because the buffer is contiguous,
-    # the instances memorypoint is accessed, and np summation runs at c speed,
-    # this is much faster than the inbuilt python sum. This is then converted to an int.
-    return int(np.sum(value.view(np.uint8), dtype=np.uint64))
+    # the buffer contents are viewed in a byte format, so each uint8 can be summed into a
+    # uint64 accumulator without widening the whole buffer.
+    byte_values = value.view(np.uint8)
+    summation = np.uint64(0)
+    for index in range(byte_values.size):
+        summation += byte_values[index]
+    return summation
+
+
+@lru_cache(maxsize=None)
+def _get_item_length(attribute_type) -> int:
+    """Get the byte length of the item type held within a list annotation.
+
+    Args:
+        attribute_type: A list annotation, such as List[CurveInformation].
+
+    Returns:
+        The byte length of a single item within the list.
+    """
+    return get_args(attribute_type)[0].get_cls_length()
+
+
+@lru_cache(maxsize=None)
+def _get_static_length(attribute_type) -> int:
+    """Get the byte length of an annotation when the attribute itself is undefined.
+
+    Args:
+        attribute_type: The annotation to get the static length from.
+
+    Returns:
+        The byte length of the annotation, including both types if it is a union.
+    """
+    try:
+        return attribute_type.get_cls_length()
+    except AttributeError:
+        type_arguments = get_args(attribute_type)
+        static_length = type_arguments[0].get_cls_length()
+        with contextlib.suppress(AttributeError):
+            static_length += type_arguments[1].get_cls_length()
+        return static_length
 
 
 class WfmFormat:  # pylint: disable=too-many-instance-attributes
@@ -355,7 +399,7 @@ class WfmFormat:  # pylint: disable=too-many-instance-attributes
         for value in self.__dict__.values():
             if isinstance(value, np.ndarray):
                 if len(value) > 100.0e6:  # noqa: PLR2004
-                    summation += calculate_checksum(value)
+                    summation += int(calculate_checksum(value))
                 else:
                     summation += int(np.add.reduce(value.view(np.uint8), dtype=np.uint64))
 
@@ -877,36 +921,39 @@ class WfmFormat:  # pylint: disable=too-many-instance-attributes
             CurveFormatsVer3.EXPLICIT_NO_DIMENSION: None,
         }
 
+        explicit_dimensions = self.explicit_dimensions
+        curve_info = self.curve_info
+        file_info = self.file_info
         # using ands for pyright instead of is in
-        if (
-            self.explicit_dimensions is not None
-            and self.curve_info is not None
-            and self.file_info is not None
-        ):
-            curve_type = curve_type_lookup[self.explicit_dimensions.first.format]
+        if explicit_dimensions is not None and curve_info is not None and file_info is not None:
+            curve_type = curve_type_lookup[explicit_dimensions.first.format]
+            # every curve type is 1, 2, 4 or 8 bytes wide, so the division can be a shift. the
+            # width is taken from the curve type, as the header bytes per point is unchecked
+            bytes_per_point_shift = curve_type.length.bit_length() - 1
             precharge_buffer_length = (
-                self.curve_info.data_start_offset - self.curve_info.precharge_start_offset
-            ) // self.file_info.bytes_per_point
+                curve_info.data_start_offset - curve_info.precharge_start_offset
+            ) >> bytes_per_point_shift
             charge_buffer_length = (
-                self.curve_info.postcharge_start_offset - self.curve_info.data_start_offset
-            ) // self.file_info.bytes_per_point
+                curve_info.postcharge_start_offset - curve_info.data_start_offset
+            ) >> bytes_per_point_shift
             postcharge_buffer_length = (
-                self.curve_info.postcharge_stop_offset - self.curve_info.postcharge_start_offset
-            ) // self.file_info.bytes_per_point
+                curve_info.postcharge_stop_offset - curve_info.postcharge_start_offset
+            ) >> bytes_per_point_shift
 
-            precharge_curve_buffer = self.get_curve_data(
-                precharge_buffer_length,
-                curve_type,
-                filestream,
-            )
-            charge_curve_buffer = self.get_curve_data(charge_buffer_length, curve_type, filestream)
-            postcharge_curve_buffer = self.get_curve_data(
-                postcharge_buffer_length,
+            # the pre, charge and post buffers are contiguous on disk, so read them in one go
+            # and hand back views into the single allocation
+            curve_data = self.get_curve_data(
+                precharge_buffer_length + charge_buffer_length + postcharge_buffer_length,
                 curve_type,
                 filestream,
             )
+            postcharge_start = precharge_buffer_length + charge_buffer_length
 
-            return precharge_curve_buffer, charge_curve_buffer, postcharge_curve_buffer
+            return (
+                curve_data[:precharge_buffer_length],
+                curve_data[precharge_buffer_length:postcharge_start],
+                curve_data[postcharge_start:],
+            )
         raise AttributeError("No primary dimensions defined in file.")
 
     # Reading
@@ -969,35 +1016,27 @@ class WfmFormat:  # pylint: disable=too-many-instance-attributes
         curve_offset = 0
 
         # iterate through each class attribute
-        for (
-            attribute_name,
-            attribute_type,
-        ) in WfmFormat.__annotations__.items():
+        for attribute_name, attribute_type in _WFM_FORMAT_ANNOTATIONS:
             attribute_value = getattr(self, attribute_name)
-            if attribute_value is not None and attribute_name not in "meta_data":
-                if isinstance(attribute_value, np.ndarray):
+            # curve buffers can be ndarray subclasses, so they need an isinstance check
+            is_array = isinstance(attribute_value, np.ndarray)
+            if attribute_value is not None and attribute_name != "meta_data":
+                if is_array:
                     byte_count += len(attribute_value) * attribute_value.dtype.itemsize
-                elif isinstance(attribute_value, List):
-                    byte_count += (
-                        len(attribute_value) * get_args(attribute_type)[0].get_cls_length()
-                    )
-                elif isinstance(attribute_value, Dimension):
+                elif type(attribute_value) is list:
+                    byte_count += len(attribute_value) * _get_item_length(attribute_type)
+                elif type(attribute_value) is Dimension:
                     byte_count += len(attribute_value.first) * 2
                 else:
                     byte_count += len(attribute_value)
             # if attribute is undefined, then we check the length of the type to get a static length
             elif attribute_name not in {"meta_data", "file_checksum"}:
-                try:
-                    byte_count += attribute_type.get_cls_length()
-                except AttributeError:
-                    byte_count += get_args(attribute_type)[0].get_cls_length()
-                    with contextlib.suppress(AttributeError):
-                        byte_count += get_args(attribute_type)[1].get_cls_length()
+                byte_count += _get_static_length(attribute_type)
 
             if (
                 attribute_value is not None
                 and attribute_name not in {"file_checksum", "meta_data"}
-                and not isinstance(attribute_value, np.ndarray)
+                and not is_array
             ):
                 curve_offset = byte_count
         return byte_count + eof_offset, curve_offset
@@ -1016,7 +1055,7 @@ class WfmFormat:  # pylint: disable=too-many-instance-attributes
         """
         # if there is no dimension, create the first one
         if dimension is not None:
-            dimension = replace(dimension, second=data_class)
+            dimension = Dimension(first=dimension.first, second=data_class)
         # other wise fill the second dimension
         else:
             dimension = Dimension(first=data_class, second=None)
@@ -1036,11 +1075,15 @@ class WfmFormat:  # pylint: disable=too-many-instance-attributes
             int: (2, Long),
             float: (3, Double),
         }
-        String8("tekmeta!").pack(endian.struct, filestream)
-        UnsignedLong(len(self.meta_data)).pack(endian.struct, filestream)
+        # build the whole post-amble in memory so that it is written in a single call
+        meta_buffer = io.BytesIO()
+        String8("tekmeta!").pack(endian.struct, meta_buffer)
+        UnsignedLong(len(self.meta_data)).pack(endian.struct, meta_buffer)
         for key, value in self.meta_data.items():
-            UnsignedLong(len(key)).pack(endian.struct, filestream)
-            filestream.write(struct.pack(f"{endian.struct}{len(key)}s", key.encode("utf_8")))
+            # strings are raw bytes behind their length prefix, no struct packing is needed
+            key_bytes = key.encode("utf_8")
+            UnsignedLong(len(key_bytes)).pack(endian.struct, meta_buffer)
+            meta_buffer.write(key_bytes)
 
             if type(value) in tek_meta_indicator:
                 type_indicator = tek_meta_indicator[type(value)][0]
@@ -1049,11 +1092,17 @@ class WfmFormat:  # pylint: disable=too-many-instance-attributes
                 type_indicator = value.tek_meta
                 byte_type = type(value)
 
-            Char(type_indicator).pack(endian.struct, filestream)
+            Char(type_indicator).pack(endian.struct, meta_buffer)
             if type_indicator == 1:
-                UnsignedLong(len(value)).pack(endian.struct, filestream)
                 if isinstance(value, str):
                     value = value.encode("utf_8")  # noqa: PLW2901
-                filestream.write(struct.pack(f"{endian.struct}{len(value)}s", value))
+                UnsignedLong(len(value)).pack(endian.struct, meta_buffer)
+                meta_buffer.write(value)
             else:
-                byte_type(value).pack(endian.struct, filestream)
+                byte_type(value).pack(endian.struct, meta_buffer)
+
+        filestream.write(meta_buffer.getvalue())
+
+
+# the annotations of the format, in the order they are written to the file
+_WFM_FORMAT_ANNOTATIONS = tuple(WfmFormat.__annotations__.items())
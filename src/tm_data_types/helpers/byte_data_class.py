@@ -1,14 +1,38 @@
 """Data types for different classes that need to be saved as byte values."""
 
 import struct
+import threading
 
-from typing import Any, Dict, get_args, List, Optional, TextIO, Type, TypeVar
+from functools import lru_cache, partial
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    get_args,
+    get_origin,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from pydantic import model_validator
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 
 T = TypeVar("T")
 
+# a per thread buffer which structured information is read into, reused across reads
+_READ_BUFFERS = threading.local()
+# a translation table which maps alphabetic characters to 1 and every other character to 0
+_ALPHA_MASK = bytes(int(chr(character).isalpha()) for character in range(256))
+# marks a field which has no class level default, such as one with a default factory
+_MISSING = object()
+
 
 def convert_to_type(field_type: T, value_to_convert: Any) -> Optional[T]:
     """Convert the value provided to the first instance of a usable typecast recursively.
@@ -27,13 +51,10 @@ def convert_to_type(field_type: T, value_to_convert: Any) -> Optional[T]:
     try:
         if isinstance(value_to_convert, bytes):
             # try to convert the type
-            string_to_convert = ""
-            for character in value_to_convert:
-                if chr(character).isalpha():
-                    string_to_convert += chr(character)
-                else:
-                    break
-            converted_value = string_to_convert
+            converted_value = _alpha_prefix(value_to_convert)
+        elif type(value_to_convert) is field_type:
+            # the value is already the exact type, so there is nothing to cast
+            converted_value = value_to_convert
         else:
             converted_value = field_type(value_to_convert)  # pyright: ignore [reportCallIssue]
         # no error means we are able to do it
@@ -44,7 +65,7 @@ def convert_to_type(field_type: T, value_to_convert: Any) -> Optional[T]:
         if value_to_convert is None and field_type is type(None):
             return None
         # if it's Optional or Union, we can get args from it
-        for recursed_type in get_args(field_type):
+        for recursed_type in _get_type_args(field_type):
             try:
                 # recurse
                 convert_to_type(recursed_type, value_to_convert)
@@ -60,10 +81,200 @@ def convert_to_type(field_type: T, value_to_convert: Any) -> Optional[T]:
     raise error
 
 
+@lru_cache(maxsize=None)
+def _get_type_args(field_type: Any) -> Tuple[Any, ...]:
+    """Get the type arguments of an annotation, cached as annotations are class level constants.
+
+    Args:
+        field_type: The type annotation to get the arguments of.
+
+    Returns:
+        The type arguments of the annotation.
+    """
+    return get_args(field_type)
+
+
+def _alpha_prefix(value: bytes) -> str:
+    """Convert the leading alphabetic characters of a byte sequence into a string.
+
+    Args:
+        value: The byte sequence to convert.
+
+    Returns:
+        The characters before the first non alphabetic character.
+    """
+    if (prefix_length := value.translate(_ALPHA_MASK).find(0)) != -1:
+        value = value[:prefix_length]
+    return value.decode("latin_1")
+
+
+def _build_converter(field_type: Any) -> Callable[[Any], Any]:
+    """Build a converter specialized to a single field annotation.
+
+    The converter behaves as convert_to_type does, without inspecting the annotation on every call.
+
+    Args:
+        field_type: The type annotation the converter casts values to.
+
+    Returns:
+        A callable which type casts a value to the field annotation.
+    """
+    if get_origin(field_type) is Union:
+        return _build_union_converter(field_type)
+    if get_args(field_type) or not isinstance(field_type, type):
+        # any other generic annotation is left to the general conversion
+        return partial(convert_to_type, field_type)
+
+    def convert(value_to_convert: Any) -> Any:
+        if isinstance(value_to_convert, bytes):
+            return _alpha_prefix(value_to_convert)
+        if type(value_to_convert) is field_type:
+            # the value is already the exact type, so there is nothing to cast
+            return value_to_convert
+        try:
+            return field_type(value_to_convert)
+        except TypeError as e:
+            # we can't convert None, field type is needs to be used here as we can't isinstance None
+            if value_to_convert is None and field_type is type(None):
+                return None
+            raise _conversion_error(field_type, value_to_convert) from e
+        except ValueError as e:
+            raise _conversion_error(field_type, value_to_convert) from e
+
+    return convert
+
+
+def _build_union_converter(field_type: Any) -> Callable[[Any], Any]:
+    """Build a converter which tries each type of an Optional or Union annotation in order.
+
+    Args:
+        field_type: The Optional or Union annotation the converter casts values to.
+
+    Returns:
+        A callable which type casts a value to the first usable type of the annotation.
+    """
+    type_args = get_args(field_type)
+    candidates = tuple(_build_converter(type_arg) for type_arg in type_args)
+    accepts_none = type(None) in type_args
+
+    def convert(value_to_convert: Any) -> Any:
+        if isinstance(value_to_convert, bytes):
+            return _alpha_prefix(value_to_convert)
+        if value_to_convert is None and accepts_none:
+            return None
+        for candidate in candidates:
+            try:
+                converted_value = candidate(value_to_convert)
+            except TypeError:
+                continue
+            # we can't convert None
+            return None if value_to_convert is None else converted_value
+        raise _conversion_error(field_type, value_to_convert)
+
+    return convert
+
+
+def _build_unpacked_converter(field_type: Any, converter: Callable[[Any], Any]) -> Callable:
+    """Build a converter from an unpacked struct value to the value validation would produce.
+
+    Args:
+        field_type: The byte data type annotation of the field.
+        converter: The converter built for the field annotation.
+
+    Returns:
+        A callable which converts an unpacked value to the field value.
+    """
+    if not issubclass(field_type, bytes):
+        return converter
+
+    def convert(value_to_convert: Any) -> Any:
+        # byte values are converted to a string, which validation then encodes back into bytes
+        return field_type(converter(value_to_convert).encode("utf_8"))
+
+    return convert
+
+
+def _build_field_getter(field_names: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """Build a getter which returns the values of the fields as a tuple in a single call.
+
+    Args:
+        field_names: The names of the fields to get.
+
+    Returns:
+        A callable which returns a tuple of the field values of an instance.
+    """
+    if len(field_names) > 1:
+        return attrgetter(*field_names)
+    # a single name returns the bare value rather than a tuple, and no names are not allowed
+    single_getters = tuple(attrgetter(field_name) for field_name in field_names)
+    return lambda instance: tuple(getter(instance) for getter in single_getters)
+
+
+def _conversion_error(field_type: Any, value_to_convert: Any) -> TypeError:
+    """Create the error raised when a value cannot be type cast to a field annotation.
+
+    Args:
+        field_type: The type annotation that was being converted to.
+        value_to_convert: The value which could not be converted.
+
+    Returns:
+        The error to raise.
+    """
+    return TypeError(f"Type {type(value_to_convert)} cannot be converted to type {field_type}.")
+
+
+def _read_exactly(filestream: TextIO, size: int) -> Union[bytes, bytearray]:
+    """Read a number of bytes from the file, reusing a buffer when the stream allows it.
+
+    Args:
+        filestream: The file buffer that is being read from.
+        size: The number of bytes to read.
+
+    Returns:
+        A buffer which starts with the bytes that were read.
+    """
+    read_into = getattr(filestream, "readinto", None)
+    if read_into is None:
+        # text based streams cannot read into a buffer
+        return filestream.read(size)
+    buffer = getattr(_READ_BUFFERS, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = _READ_BUFFERS.buffer = bytearray(size)
+    with memoryview(buffer) as buffer_view:
+        bytes_read = read_into(buffer_view[:size])
+    if bytes_read != size:
+        raise struct.error(f"unpack requires a buffer of {size} bytes")
+    return buffer
+
+
 @pydantic_dataclass(frozen=False)
 class EnforcedTypeDataClass:
     """A class which force type casts the field annotations, including child class variables."""
 
+    ################################################################################################
+    # Class Variables
+    ################################################################################################
+
+    # the converter for each field annotation, filled in for every child class
+    _field_converters: ClassVar[Dict[str, Callable[[Any], Any]]] = {}
+
+    ################################################################################################
+    # Dunder Methods
+    ################################################################################################
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build a converter for each field annotation, including those of the parent classes."""
+        super().__init_subclass__(**kwargs)
+        fields = vars(cls).get("__annotations__", {})
+        cls._field_converters = {
+            **cls._field_converters,
+            # a redeclared annotation takes precedence, the same as its default
+            **{
+                field_name: _build_converter(field_type)
+                for field_name, field_type in fields.items()
+            },
+        }
+
     ################################################################################################
     # Public Methods
     ################################################################################################
@@ -74,31 +285,42 @@ class EnforcedTypeDataClass:
         # pylint: disable=no-member
         """Pre-init enforced type cast."""
         new_values = {}
-        # iterate through the parent objects
-        for base in cls.__mro__:  # pyright: ignore [reportAttributeAccessIssue]
-            # if the class is self, exit the iteration
-            if base is EnforcedTypeDataClass:
-                break
-            # if there is no class variables in the child
-            try:
-                _ = base.__annotations__
-            except AttributeError:
-                continue
-
-            for field_name, field_type in base.__annotations__.items():
-                # find the value to convert
-                try:
-                    value_to_convert = values.kwargs[field_name]
-                except (KeyError, TypeError) as e:
-                    # if pre-defined as a "no_default" value, error if not provided
-                    if (value_to_convert := getattr(base, field_name)) == "no_default":
-                        raise TypeError(
-                            f"__init__ missing 1 required argument: {field_name}",
-                        ) from e
-                # type cast the vlue
-                new_values[field_name] = convert_to_type(field_type, value_to_convert)
+        provided_values = values.kwargs or {}
+        for field_name, (converter, default) in cls._get_merged_fields().items():
+            # find the value to convert, if the default is "no_default" error if not provided
+            if field_name in provided_values:
+                value_to_convert = provided_values[field_name]
+            elif default is _MISSING or default == "no_default":
+                raise TypeError(f"__init__ missing 1 required argument: {field_name}")
+            else:
+                value_to_convert = default
+            # type cast the value
+            new_values[field_name] = converter(value_to_convert)
         return new_values
 
+    ################################################################################################
+    # Private Methods
+    ################################################################################################
+
+    @classmethod
+    def _get_merged_fields(cls) -> Dict[str, Tuple[Callable[[Any], Any], Any]]:
+        """Get the converter and default of every field, merging them on first use.
+
+        The defaults are only final once the dataclass decorator has run on the class.
+
+        Returns:
+            A mapping of each field name to its converter and default value.
+        """
+        try:
+            return vars(cls)["_merged_fields"]
+        except KeyError:
+            merged_fields = {
+                field_name: (converter, getattr(cls, field_name, _MISSING))
+                for field_name, converter in cls._field_converters.items()
+            }
+            cls._merged_fields = merged_fields
+            return merged_fields
+
 
 class StructuredInfo(EnforcedTypeDataClass):
     """A class which contains information structured to be read from or written to."""
@@ -107,12 +329,25 @@ class StructuredInfo(EnforcedTypeDataClass):
     # Dunder Methods
     ################################################################################################
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the layout of the structured class, as its annotations never change."""
+        super().__init_subclass__(**kwargs)
+        fields = vars(cls).get("__annotations__", {})
+        cls._field_names: Tuple[str, ...] = tuple(fields)
+        cls._get_field_values = staticmethod(_build_field_getter(cls._field_names))
+        cls._default_fmt: str = "".join(field.struct_repr for field in fields.values())
+        cls._total_length: int = sum(field.length for field in fields.values())
+        cls._struct_cache: Dict[Tuple[str, Optional[Tuple[str, ...]]], struct.Struct] = {
+            (endian, None): struct.Struct(endian + cls._default_fmt) for endian in ("<", ">")
+        }
+        cls._unpacked_converters: Tuple[Callable[[Any], Any], ...] = tuple(
+            _build_unpacked_converter(field_type, cls._field_converters[field_name])
+            for field_name, field_type in fields.items()
+        )
+
     def __len__(self):
         """Sum the number of bytes for all annotations in this dataclass."""
-        total_length = 0
-        for value in self.__annotations__.values():  # pylint: disable=no-member
-            total_length += value.length
-        return total_length
+        return self._total_length
 
     ################################################################################################
     # Public Methods
@@ -135,25 +370,17 @@ class StructuredInfo(EnforcedTypeDataClass):
             in_order: If the contents should be unpacked in definition order or provided order.
             order: The order in which to unpack the contents.
         """
-        length = 0
-        struct_repr_str = ""
         if not in_order and not order:
             raise IndexError("Requested custom order unpacking, but order not provided")
 
-        if not in_order and order:  # noqa: SIM108
-            unpacking_order = order
-        else:
-            # this only works because dictionaries preserve order
-            unpacking_order = cls.__annotations__.keys()
-
-        for key in unpacking_order:
-            if key in cls.__annotations__:
-                field = cls.__annotations__[key]
-                struct_repr_str += field.struct_repr
-                length += field.length
-        info = struct.unpack(endian + struct_repr_str, filestream.read(length))
-        output_list = {key: value for value, key in zip(info, unpacking_order)}
-        return cls(**output_list)
+        if not in_order and order:
+            packer = cls._get_struct(endian, tuple(order))
+            info = packer.unpack_from(_read_exactly(filestream, packer.size))
+            return cls(**dict(zip(order, info)))
+
+        packer = cls._get_struct(endian)
+        info = packer.unpack_from(_read_exactly(filestream, packer.size))
+        return cls._fast_construct(info)
 
     # Writing
     def pack(
@@ -172,39 +399,77 @@ class StructuredInfo(EnforcedTypeDataClass):
             order: The order in which to unpack the contents.
         """
         # pylint: disable=no-member
-        struct_repr_str = ""
         if not in_order and not order:
             raise IndexError("Requested custom order unpacking, but order not provided")
 
-        if not in_order and order:  # noqa: SIM108
-            packing = order
+        if not in_order and order:
+            packer = self._get_struct(endian, tuple(order))
+            value = [getattr(self, key) for key in order if key in self.__annotations__]
         else:
-            # this only works because dictionaries preserve order
-            packing = self.__annotations__.keys()
-
-        value = []
+            packer = self._get_struct(endian)
+            value = self._get_field_values(self)
 
-        for key in packing:
-            if key in self.__annotations__:
-                attribute_value = getattr(self, key)
-                value.append(attribute_value)
-                struct_repr_str += attribute_value.struct_repr
-        filestream.write(struct.pack(endian + struct_repr_str, *value))
+        filestream.write(packer.pack(*value))
 
     # Writing
     def get_value_summation(self):
         """Sum each byte for all annotations in this dataclass."""
-        total_summation = 0
-        for key in self.__annotations__:  # pylint: disable=no-member
-            value = getattr(self, key)
-            total_summation += value.get_value_summation()
-        return total_summation
+        # native sizes match the summation of each datum, and alignment padding only adds zeros
+        packer = self._get_struct("@")
+        return sum(packer.pack(*self._get_field_values(self)))
 
     # Writing
     @classmethod
     def get_cls_length(cls):
         """Sum the number of bytes for all annotations in this dataclass."""
-        total_length = 0
-        for field in cls.__annotations__.values():
-            total_length += field.length
-        return total_length
+        return cls._total_length
+
+    ################################################################################################
+    # Private Methods
+    ################################################################################################
+
+    @classmethod
+    def _fast_construct(cls: Type[T], info: Tuple[Any, ...]) -> T:
+        """Create the structured class from values unpacked in definition order.
+
+        The unpacked values already have the width of each field, so the pydantic validation is
+        skipped and each value is only converted to the type validation would have produced.
+
+        Args:
+            info: The values unpacked in definition order.
+
+        Returns:
+            The structured class filled with the converted values.
+        """
+        instance = cls.__new__(cls)
+        vars(instance).update(
+            zip(
+                cls._field_names,
+                [converter(value) for converter, value in zip(cls._unpacked_converters, info)],
+            )
+        )
+        return instance
+
+    @classmethod
+    def _get_struct(cls, endian: str, order: Optional[Tuple[str, ...]] = None) -> struct.Struct:
+        """Get the compiled struct for an endian and field order, compiling it on first use.
+
+        Args:
+            endian: The order in which the bytes should be read or written.
+            order: The order of the fields, or None for definition order.
+
+        Returns:
+            The compiled struct for the fields in the requested order.
+        """
+        key = (endian, order)
+        try:
+            return cls._struct_cache[key]
+        except KeyError:
+            if order is None:
+                struct_repr_str = cls._default_fmt
+            else:
+                fields = cls.__annotations__
+                struct_repr_str = "".join(
+                    fields[name].struct_repr for name in order if name in fields
+                )
+            return cls._struct_cache.setdefault(key, struct.Struct(endian + struct_repr_str))
@@ -3,7 +3,7 @@
 import struct
 
 from abc import ABC
-from typing import Any, Optional, TextIO
+from typing import Any, Dict, Optional, TextIO
 
 from pydantic import GetCoreSchemaHandler
 from pydantic_core import core_schema, CoreSchema
@@ -25,6 +25,11 @@ class ByteData(ABC):  # noqa: B024
     # Dunder Methods
     ################################################################################################
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give each datum its own cache of compiled structs, as their formats differ."""
+        super().__init_subclass__(**kwargs)
+        cls._packers: Dict[str, struct.Struct] = {}
+
     def __len__(self):
         """Get the length of the datum."""
         return self.get_cls_length()
@@ -48,7 +53,7 @@ class ByteData(ABC):  # noqa: B024
             endian: The Endianness of the waveform format.
             filestream: The filestream that will be written to.
         """
-        filestream.write(struct.pack(endian + self.struct_repr, self))
+        filestream.write(self._get_struct(endian).pack(self))
 
     @classmethod
     def unpack(cls, endian: str, filestream: TextIO):
@@ -58,7 +63,8 @@ class ByteData(ABC):  # noqa: B024
             endian: The Endianness of the waveform format.
             filestream: The filestream that will be read from.
         """
-        (info,) = struct.unpack(endian + cls.struct_repr, filestream.read(cls.length))
+        packer = cls._get_struct(endian)
+        (info,) = packer.unpack(filestream.read(packer.size))
         return cls(info)
 
     @classmethod
@@ -66,6 +72,25 @@ class ByteData(ABC):  # noqa: B024
         """Get the length of the datum, reflects the StructuredInfo class."""
         return cls.length
 
+    ################################################################################################
+    # Private Methods
+    ################################################################################################
+
+    @classmethod
+    def _get_struct(cls, endian: str) -> struct.Struct:
+        """Get the compiled struct for the datum in an endian, compiling it on first use.
+
+        Args:
+            endian: The Endianness of the waveform format.
+
+        Returns:
+            The compiled struct for the datum.
+        """
+        try:
+            return cls._packers[endian]
+        except KeyError:
+            return cls._packers.setdefault(endian, struct.Struct(endian + cls.struct_repr))
+
 
 class String(ByteData, bytes):
     """A byte string which can be used in pydantic."""
@@ -99,12 +124,13 @@ class String(ByteData, bytes):
         Args:
             x: The value of the datum.
         """
+        if isinstance(x, bytes):
+            # values read from a file are already bytes
+            return bytes.__new__(cls, x)
         if isinstance(x, int):
-            x = x.to_bytes(length=cls.length, byteorder="big").zfill(cls.length)
+            x = x.to_bytes(length=cls.length, byteorder="big")
         elif isinstance(x, str):
-            x = str.encode(x.ljust(cls.length, "\x00"))
-        else:
-            pass
+            x = x.encode("utf_8").ljust(cls.length, b"\x00")
         return bytes.__new__(cls, x)
 
     def __str__(self):
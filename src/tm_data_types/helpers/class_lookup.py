@@ -1,7 +1,7 @@
 """Helpers used to find what type of format needs to be used to write to/read from the file."""
 
 from enum import Enum
-from typing import Dict, List, Type
+from typing import Dict, List, Tuple, Type
 
 from tm_data_types.datum.datum import Datum
 from tm_data_types.datum.waveforms.analog_waveform import AnalogWaveform
@@ -65,6 +65,37 @@ class MATFormats(CustomFormatEnum):
     WAVEFORMDIGITAL = WaveformFileMATDigital  # Digital WFM waveform
 
 
+# what formats to check based on the file extension
+_EXTENSION_LOOKUP: Dict[FileExtensions, Type[CustomFormatEnum]] = {
+    FileExtensions.CSV: CSVFormats,
+    FileExtensions.WFM: WFMFormats,
+    FileExtensions.MAT: MATFormats,
+}
+# what file format is used for each waveform type, based on the file extension
+_CLASS_FORMAT_LOOKUP: Dict[FileExtensions, Dict[Type[Datum], AbstractedFile]] = {
+    extension: {
+        AnalogWaveform: format_lookup.WAVEFORM.value,
+        IQWaveform: format_lookup.WAVEFORMIQ.value,
+        DigitalWaveform: format_lookup.WAVEFORMDIGITAL.value,
+    }
+    for extension, format_lookup in _EXTENSION_LOOKUP.items()
+}
+# what file formats can be read from, based on the file extension
+_FORMAT_LIST_LOOKUP: Dict[FileExtensions, Tuple[AbstractedFile, ...]] = {
+    extension: tuple(format_lookup.list_values())
+    for extension, format_lookup in _EXTENSION_LOOKUP.items()
+}
+# wfm and mat files are accessed via a binary write, whereas csvs are text based
+_ACCESS_TYPE_LOOKUP: Dict[bool, Dict[FileExtensions, str]] = {
+    write: {
+        FileExtensions.CSV: base_access + "+",
+        FileExtensions.WFM: base_access + "b+",
+        FileExtensions.MAT: base_access + "b+",
+    }
+    for write, base_access in ((True, "w"), (False, "r"))
+}
+
+
 def handle_extensions(
     extension: FileExtensions,
 ) -> CustomFormatEnum:
@@ -74,13 +105,7 @@ def handle_extensions(
         extension: The extensions of the file that is being written to.
     """
     try:
-        # what formats to check based on the file extension
-        extension_lookup = {
-            FileExtensions.CSV: CSVFormats,
-            FileExtensions.WFM: WFMFormats,
-            FileExtensions.MAT: MATFormats,
-        }
-        format_lookup = extension_lookup[extension]
+        format_lookup = _EXTENSION_LOOKUP[extension]
     except KeyError as e:
         raise KeyError(f"Extension {extension} cannot be written or read from.") from e
     return format_lookup
@@ -96,14 +121,11 @@ def find_class_format(
         extension: The extensions of the file that is being written to.
         waveform_type: The waveform type that is being written.
     """
-    format_lookup = handle_extensions(extension)
-    class_lookup: Dict[Type[Datum], CustomFormatEnum] = {
-        AnalogWaveform: format_lookup.WAVEFORM,
-        IQWaveform: format_lookup.WAVEFORMIQ,
-        DigitalWaveform: format_lookup.WAVEFORMDIGITAL,
-    }
-    check = waveform_type
-    return class_lookup[check].value
+    try:
+        class_lookup = _CLASS_FORMAT_LOOKUP[extension]
+    except KeyError as e:
+        raise KeyError(f"Extension {extension} cannot be written or read from.") from e
+    return class_lookup[waveform_type]
 
 
 def find_class_format_list(
@@ -114,11 +136,12 @@ def find_class_format_list(
     Args:
         extension: The extensions of the file that is being read from.
     """
-    format_lookup = handle_extensions(extension)
-
-    file_format = format_lookup.list_values()
-
-    return file_format
+    try:
+        file_formats = _FORMAT_LIST_LOOKUP[extension]
+    except KeyError as e:
+        raise KeyError(f"Extension {extension} cannot be written or read from.") from e
+    # a new list is returned so the lookup can't be changed by the caller
+    return list(file_formats)
 
 
 def access_type(extension: FileExtensions, write: bool):
@@ -128,11 +151,4 @@ def access_type(extension: FileExtensions, write: bool):
         extension: The extensions of the file that is being written to/read from.
         write: Whether the file is being written to or not.
     """
-    base_access = "w" if write else "r"
-    # wfm and mat files are accessed via a binary write, whereas csvs are text based
-    access_type_lookup = {
-        FileExtensions.CSV: base_access + "+",
-        FileExtensions.WFM: base_access + "b+",
-        FileExtensions.MAT: base_access + "b+",
-    }
-    return access_type_lookup[extension]
+    return _ACCESS_TYPE_LOOKUP[bool(write)][extension]
@@ -1,7 +1,7 @@
 """Enumerators used to enforce typing."""
 
 from enum import Enum
-from typing import cast, List
+from typing import List
 
 
 class CustomStrEnum(Enum):
@@ -10,18 +10,8 @@ class CustomStrEnum(Enum):
     This class provides better type hinting for the value property.
     """
 
-    # pylint: disable=function-redefined,invalid-overridden-method
-    @property
-    def name(
-        self,
-    ) -> str:
-        """Return the name of the Enum member."""
-        return self._name_  # pylint: disable=no-member
-
-    @property
-    def value(self) -> str:  # pylint: disable=invalid-overridden-method
-        """Return the value of the Enum member."""
-        return cast(str, self._value_)  # pylint: disable=no-member
+    # the stdlib value and name attributes are used, annotating the value only narrows its type
+    _value_: str
 
     @classmethod
     def list_values(cls) -> List[str]:
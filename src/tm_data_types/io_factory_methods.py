@@ -2,8 +2,13 @@
 
 import multiprocessing
 import os
+import shutil
 
-from typing import List, Optional, TYPE_CHECKING
+from contextlib import contextmanager, suppress
+from functools import lru_cache
+from itertools import repeat
+from multiprocessing.pool import Pool
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TYPE_CHECKING
 
 from typing_extensions import TypeVar
 
@@ -25,6 +30,41 @@ if TYPE_CHECKING:
 DatumAlias = TypeVar("DatumAlias", bound=Datum, default=Datum)
 
 
+@lru_cache(maxsize=32)
+def _resolve_write_format(
+    path_extension: str,
+    waveform_type: Type[Datum],
+) -> Tuple["AbstractedFile", str]:
+    """Find the file format and access type to write a waveform type with, cached per extension.
+
+    Args:
+        path_extension: The extension of the file that is being written to.
+        waveform_type: The waveform type that is being written.
+    """
+    try:
+        file_extension = FileExtensions[path_extension.replace(".", "").upper()]
+    except KeyError as e:
+        raise IOError(f"The {path_extension} extension cannot be written to.") from e
+    # find the format based on the waveform extension
+    format_class: AbstractedFile = find_class_format(file_extension, waveform_type)
+    return format_class, access_type(file_extension, write=True)
+
+
+@lru_cache(maxsize=32)
+def _resolve_read_formats(path_extension: str) -> Tuple[Tuple["AbstractedFile", ...], str]:
+    """Find the file formats and access type to read a file with, cached per extension.
+
+    Args:
+        path_extension: The extension of the file that is being read from.
+    """
+    try:
+        file_extension = FileExtensions[path_extension.replace(".", "").upper()]
+    except KeyError as e:
+        raise IOError(f"The {path_extension} extension cannot be read from.") from e
+    class_formats: List[AbstractedFile] = find_class_format_list(file_extension)
+    return tuple(class_formats), access_type(file_extension, write=False)
+
+
 # pylint: disable=unused-argument
 def write_file(
     path: str,
@@ -56,18 +96,46 @@ def write_file(
         file_format: A specialized file format we are writing as.
     """
     _, path_extension = os.path.splitext(path)
-    try:
-        file_extension = FileExtensions[path_extension.replace(".", "").upper()]
-    except KeyError as e:
-        raise IOError(f"The {path_extension} extension cannot be written to.") from e
-    # find the format based on the waveform extension
-    format_class: AbstractedFile = find_class_format(file_extension, type(waveform))
+    format_class, file_access = _resolve_write_format(path_extension, type(waveform))
     # using __init__ for instantiation due to pyright confusion
-    format_class = format_class(path, access_type(file_extension, write=True), product)
+    format_class = format_class(path, file_access, product)
     with format_class as fd:
         fd.write_datum(waveform)
 
 
+def write_same_file(
+    file_paths: List[str],
+    datum: Datum,
+    product: InstrumentSeries = InstrumentSeries.TEKSCOPE,
+    file_format: Optional[CSVFormats] = None,
+) -> None:
+    """Write the same waveform to a list of provided files.
+
+    Process Overview:
+        1. Writing: The waveform is written to the first file of each extension using the same
+            method as [`write_file()`][tm_data_types.write_file].
+        2. Copying: Every other file is copied from the written file with the same extension, which
+            lets the operating system copy the bytes without formatting the waveform again.
+
+    Args:
+        file_paths: The path files to write to.
+        datum: The datum that is being written.
+        product: The product being written to.
+        file_format: A specialized file format we are writing as.
+    """
+    written_files: Dict[str, str] = {}
+    # a repeated file path only needs to be written once
+    for file_path in dict.fromkeys(file_paths):
+        _, path_extension = os.path.splitext(file_path)
+        if (written_file := written_files.get(path_extension.lower())) is None:
+            write_file(file_path, datum, product, file_format)
+            written_files[path_extension.lower()] = file_path
+        else:
+            # a different path to the written file already holds the waveform
+            with suppress(shutil.SameFileError):
+                shutil.copyfile(written_file, file_path)
+
+
 def read_file(file_path: str) -> DatumAlias:
     """Read a waveform from a provided file.
 
@@ -89,13 +157,9 @@ def read_file(file_path: str) -> DatumAlias:
         file_path: The path file to read from.
     """
     _, path_extension = os.path.splitext(file_path)
-    try:
-        file_extension = FileExtensions[path_extension.replace(".", "").upper()]
-    except KeyError as e:
-        raise IOError(f"The {path_extension} extension cannot be read from.") from e
-    class_formats: List[AbstractedFile] = find_class_format_list(file_extension)
+    class_formats, file_access = _resolve_read_formats(path_extension)
     for file_format in class_formats:
-        with file_format(file_path, access_type(file_extension, write=False)) as fd:
+        with file_format(file_path, file_access) as fd:
             if fd.check_style():
                 waveform = fd.read_datum()
                 return waveform
@@ -120,22 +184,62 @@ def read_iq_file(file_path: str) -> IQWaveform:
     return read_file(file_path)
 
 
-def _write_files(
-    file_paths: List[str],
-    datums: List[Datum],
-    product: InstrumentSeries = InstrumentSeries.TEKSCOPE,
-    file_format: Optional[CSVFormats] = None,
+def _write_one(
+    write_arguments: Tuple[str, Datum, InstrumentSeries, Optional[CSVFormats]],
 ) -> None:
-    """Write a list of waveforms to a list of provided files.
+    """Write a single waveform to a provided file, used as the task of a process pool.
 
     Args:
-        file_paths: The path file to write to.
-        datums: The datum that is being written.
-        product: The product being written to.
-        file_format: A specialized file format we are writing as.
+        write_arguments: The file path, datum, product and file format to write with.
+    """
+    write_file(*write_arguments)
+
+
+def _get_chunk_size(item_count: int, process_count: int) -> int:
+    """Get how many items each process pool task should handle.
+
+    Small chunks let idle processes pick up the remaining work, rather than waiting on the slowest
+    process to finish a large static partition.
+
+    Args:
+        item_count: The number of items being processed.
+        process_count: The number of processes in the pool.
+    """
+    return max(1, item_count // (max(1, process_count) * 4))
+
+
+@contextmanager
+def _open_process_pool(
+    process_pool: Optional[Pool],
+    process_count: int,
+    **pool_arguments: Any,
+) -> Iterator[Pool]:
+    """Use the provided process pool, or create one which is closed once the work is done.
+
+    Args:
+        process_pool: An existing process pool to use.
+        process_count: The number of processes to create when no pool is provided.
+        pool_arguments: Any other arguments used to create the process pool, such as an
+            initializer, which are not used when a pool is provided.
     """
-    for file_path, datum in zip(file_paths, datums):
-        write_file(file_path, datum, product, file_format)
+    if process_pool is not None:
+        yield process_pool
+        return
+    with multiprocessing.Pool(process_count, **pool_arguments) as new_process_pool:
+        yield new_process_pool
+
+
+def _wait_for_writes(written_files: Iterator[None]) -> None:
+    """Wait for every write of a process pool to finish, raising the first error.
+
+    Args:
+        written_files: The results of the writes, in the order they finish.
+    """
+    try:
+        for _ in written_files:
+            pass
+    except Exception as e:
+        raise ChildProcessError("Error writing a file, view process stack.") from e
 
 
 def write_files_in_parallel(
@@ -144,14 +248,16 @@ def write_files_in_parallel(
     force_process_count: int = 4,
     product: InstrumentSeries = InstrumentSeries.TEKSCOPE,
     file_format: Optional[CSVFormats] = None,
+    process_pool: Optional[Pool] = None,
 ) -> None:
     """Write a list of waveforms to a list of provided files in parallel.
 
     This method offers a parallelized approach to writing multiple waveform files.
 
     Process Overview:
-        1. Multiprocessing: The lists of file paths and waveforms are partitioned and processed in
-            parallel.
+        1. Multiprocessing: The file paths and waveforms are handed out to the processes in small
+            chunks, so that no process is left idle while another works through a large share.
+            The chunks are collected in whichever order they finish.
         2. Writing: Each process uses the same method as  [`write_file()`][tm_data_types.write_file]
             to save its assigned waveforms.
 
@@ -160,91 +266,182 @@ def write_files_in_parallel(
     Args:
         file_paths: The path file to write to.
         datums: The datum that is being written.
-        force_process_count: The number of processes that will be created.
+        force_process_count: The number of processes that will be created, or the number of
+            processes in the provided pool.
         product: The product being written to.
         file_format: A specialized file format we are writing as.
+        process_pool: An existing process pool to use, rather than creating one for this call.
     """
     if len(file_paths) != len(datums):
         msg = "The number of files paths must be equal to the number of waveforms to write."
         raise IndexError(msg)
+    if not file_paths:
+        return
     process_count = min(force_process_count, len(file_paths))
-    with multiprocessing.Pool(process_count) as process_pool:
-        previous_index = 0
-        for index in range(process_count):
-            end_index = min(
-                round((index + 1) * (len(file_paths) / process_count)) + 1,
-                len(file_paths),
-            )
-            result = process_pool.apply_async(
-                _write_files,
-                args=(
-                    file_paths[previous_index:end_index],
-                    datums[previous_index:end_index],
-                    product,
-                    file_format,
-                ),
-            )
-            previous_index = end_index
+    write_arguments = zip(file_paths, datums, repeat(product), repeat(file_format))
+    with _open_process_pool(process_pool, process_count) as used_process_pool:
+        written_files = used_process_pool.imap_unordered(
+            _write_one,
+            write_arguments,
+            chunksize=_get_chunk_size(len(file_paths), process_count),
+        )
+        _wait_for_writes(written_files)
 
-        for index in range(process_count):
-            try:
-                result.get()
-            except Exception as e:  # noqa: PERF203
-                raise ChildProcessError(f"Error on process {index}, view process stack.") from e
 
+# the arguments shared by every write of a process, set once when the process starts
+_shared_write_arguments: Optional[Tuple[Datum, InstrumentSeries, Optional[CSVFormats]]] = None
 
-def _read_files(file_paths: str, file_queue: multiprocessing.Queue) -> None:
-    """Read a waveform from a provided file.
+
+def _set_shared_write_arguments(
+    datum: Datum,
+    product: InstrumentSeries,
+    file_format: Optional[CSVFormats],
+) -> None:
+    """Store the arguments shared by every write in the process, used as a pool initializer.
 
     Args:
-        file_paths: The file paths to read from.
-        file_queue: The queue to put the read data into.
+        datum: The datum that is being written.
+        product: The product being written to.
+        file_format: A specialized file format we are writing as.
     """
-    for file_path in file_paths:
-        file_queue.put((file_path, read_file(file_path)))
+    global _shared_write_arguments  # noqa: PLW0603  # pylint: disable=global-statement
+    _shared_write_arguments = (datum, product, file_format)
 
 
-def read_files_in_parallel(file_paths: List[str], force_process_count: int = 4) -> List[Datum]:
-    """Read a list of files in parallel.
+def _write_shared(file_path: str) -> None:
+    """Write the datum shared by the process to a provided file, used as the task of a pool.
+
+    Args:
+        file_path: The file path to write to.
+    """
+    if _shared_write_arguments is None:
+        raise ChildProcessError("No shared datum was provided to the process.")
+    write_file(file_path, *_shared_write_arguments)
+
+
+def write_same_file_in_parallel(
+    file_paths: List[str],
+    datum: Datum,
+    force_process_count: int = 4,
+    product: InstrumentSeries = InstrumentSeries.TEKSCOPE,
+    file_format: Optional[CSVFormats] = None,
+    process_pool: Optional[Pool] = None,
+) -> None:
+    """Write the same waveform to a list of provided files in parallel.
+
+    Process Overview:
+        1. Multiprocessing: The waveform is sent to each process once when it starts, then only
+            the file paths are handed out to the processes in small chunks.
+        2. Writing: Each process uses the same method as  [`write_file()`][tm_data_types.write_file]
+            to save the waveform to its assigned files.
 
-    This method allows for the parallel reading of multiple waveform files.
+    This avoids sending a copy of the waveform to the processes for every file it is written to.
+    An existing process pool has already started, so the waveform is instead sent with each chunk
+    of file paths.
+
+    Args:
+        file_paths: The path files to write to.
+        datum: The datum that is being written.
+        force_process_count: The number of processes that will be created, or the number of
+            processes in the provided pool.
+        product: The product being written to.
+        file_format: A specialized file format we are writing as.
+        process_pool: An existing process pool to use, rather than creating one for this call.
+    """
+    if not file_paths:
+        return
+    process_count = min(force_process_count, len(file_paths))
+    chunk_size = _get_chunk_size(len(file_paths), process_count)
+    if process_pool is None:
+        write_task, write_arguments = _write_shared, file_paths
+    else:
+        # a chunk is pickled as a whole, so the repeated waveform is only pickled once per chunk
+        write_task = _write_one
+        write_arguments = zip(file_paths, repeat(datum), repeat(product), repeat(file_format))
+    with _open_process_pool(
+        process_pool,
+        process_count,
+        initializer=_set_shared_write_arguments,
+        initargs=(datum, product, file_format),
+    ) as used_process_pool:
+        written_files = used_process_pool.imap_unordered(
+            write_task,
+            write_arguments,
+            chunksize=chunk_size,
+        )
+        _wait_for_writes(written_files)
+
+
+def _read_one(file_path: str) -> Tuple[str, Datum]:
+    """Read a waveform from a provided file, used as the task of a process pool.
+
+    Args:
+        file_path: The file path to read from.
+    """
+    return file_path, read_file(file_path)
+
+
+def iread_files_in_parallel(
+    file_paths: List[str],
+    force_process_count: int = 4,
+    process_pool: Optional[Pool] = None,
+) -> Iterator[Tuple[str, Datum]]:
+    """Read a list of files in parallel, yielding each waveform as soon as it has been read.
+
+    Only the waveforms which have been read but not yet consumed are held in memory, rather than
+    every waveform in the list at once.
 
     Process Overview:
         1. Multiprocessing: Similar to
             [`write_files_in_parallel()`][tm_data_types.write_files_in_parallel], the file paths are
-            partitioned and processed in parallel.
+            handed out to the processes in small chunks.
         2. Reading: The waveforms are read using the same process as
-            [`read_file()`][tm_data_types.read_file], and a queue of waveforms is returned.
+            [`read_file()`][tm_data_types.read_file], and each file path and waveform are yielded
+            in the order they finish reading.
 
     Args:
         file_paths: A list of file paths to read from.
-        force_process_count: The number of processes that should be created for this operation.
+        force_process_count: The number of processes that should be created for this operation,
+            or the number of processes in the provided pool.
+        process_pool: An existing process pool to use, rather than creating one for this call.
     """
+    if not file_paths:
+        return
     process_count = min(force_process_count, len(file_paths))
-    with multiprocessing.Pool(process_count) as process_pool:
-        previous_index = 0
-        manager = multiprocessing.Manager()
-        file_queue = manager.Queue()
-        for index in range(process_count):
-            end_index = min(
-                round((index + 1) * (len(file_paths) / process_count)) + 1,
-                len(file_paths),
+    with _open_process_pool(process_pool, process_count) as used_process_pool:
+        try:
+            yield from used_process_pool.imap_unordered(
+                _read_one,
+                file_paths,
+                chunksize=_get_chunk_size(len(file_paths), process_count),
             )
+        except Exception as e:
+            raise ChildProcessError("Error reading a file, view process stack.") from e
 
-            result = process_pool.apply_async(
-                _read_files,
-                args=(
-                    file_paths[previous_index:end_index],
-                    file_queue,
-                ),
-            )
-            previous_index = end_index
 
-        for index in range(process_count):
-            try:
-                result.get()
-            except Exception as e:  # noqa: PERF203
-                raise ChildProcessError(f"Error on process {index}, view process stack.") from e
+def read_files_in_parallel(
+    file_paths: List[str],
+    force_process_count: int = 4,
+    process_pool: Optional[Pool] = None,
+) -> List[Tuple[str, Datum]]:
+    """Read a list of files in parallel.
+
+    This method allows for the parallel reading of multiple waveform files. To handle each
+    waveform as it is read instead, use
+    [`iread_files_in_parallel()`][tm_data_types.iread_files_in_parallel].
+
+    Process Overview:
+        1. Multiprocessing: Similar to
+            [`write_files_in_parallel()`][tm_data_types.write_files_in_parallel], the file paths are
+            handed out to the processes in small chunks.
+        2. Reading: The waveforms are read using the same process as
+            [`read_file()`][tm_data_types.read_file], and each file path and waveform are returned
+            in the order they finish reading.
 
-    file_queue.put(None)
-    return list(iter(file_queue.get, None))
+    Args:
+        file_paths: A list of file paths to read from.
+        force_process_count: The number of processes that should be created for this operation,
+            or the number of processes in the provided pool.
+        process_pool: An existing process pool to use, rather than creating one for this call.
+    """
+    return list(iread_files_in_parallel(file_paths, force_process_count, process_pool))
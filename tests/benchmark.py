@@ -1,10 +1,14 @@
 """Test the benchmark of how well the system performs reading and writing files."""
 
+import multiprocessing
 import os
 import tempfile
 import timeit
 
+from collections import deque
 from dataclasses import asdict, dataclass
+from functools import partial
+from multiprocessing.pool import Pool
 from typing import Callable, List, Optional, Tuple, Union
 
 import matplotlib.pyplot as plt
@@ -21,6 +25,8 @@ from tm_data_types.io_factory_methods import (
     read_files_in_parallel,
     write_file,
     write_files_in_parallel,
+    write_same_file,
+    write_same_file_in_parallel,
 )
 
 
@@ -41,8 +47,61 @@ def write_files_serial(file_paths: List[str], datums: List[AnalogWaveform]) -> N
         file_paths: The file paths to read from.
         datums: The waveforms that are being written.
     """
-    for file_path, datum in zip(file_paths, datums):
-        write_file(file_path, datum)
+    # the results are discarded without building a list of them
+    deque(map(write_file, file_paths, datums), maxlen=0)
+
+
+def write_files_copied(file_paths: List[str], datums: List[AnalogWaveform]) -> None:
+    """Write the same waveform once, then copy the written file to the other file paths.
+
+    Args:
+        file_paths: The file paths to write to.
+        datums: The waveforms that are being written, which must all be the same waveform.
+    """
+    if not all(datum is datums[0] for datum in datums):
+        raise ValueError("Only the same waveform can be copied to each file path.")
+    write_same_file(file_paths, datums[0])
+
+
+def write_files_parallel(
+    file_paths: List[str],
+    datums: List[AnalogWaveform],
+    process_pool: Optional[Pool] = None,
+) -> None:
+    """Write to the provided file paths using the waveforms in parallel.
+
+    Args:
+        file_paths: The file paths to write to.
+        datums: The waveforms that are being written.
+        process_pool: An existing process pool to write with.
+    """
+    if datums and all(datum is datums[0] for datum in datums):
+        # the same waveform only needs to be sent to each process once
+        write_same_file_in_parallel(file_paths, datums[0], process_pool=process_pool)
+    else:
+        write_files_in_parallel(file_paths, datums, process_pool=process_pool)
+
+
+def create_sin_wave(buffer_length: int) -> AnalogWaveform:
+    """Create a waveform holding a single period of a sine wave.
+
+    Args:
+        buffer_length: The number of points in the waveform.
+
+    Returns:
+        The sine waveform.
+    """
+    x_points = np.linspace(0, 1, buffer_length)
+    sin_data: NDArray[np.float64] = np.sin(2 * np.pi * x_points)
+
+    sin_wave = AnalogWaveform()
+    sin_wave.y_axis_values = sin_data
+    sin_wave.y_axis_extent_magnitude = 0.1
+    sin_wave.y_axis_offset = 0.0
+    sin_wave.x_axis_spacing = 1.0e-7
+
+    sin_wave.measured_data = RawSample(sin_wave.y_axis_values, as_type=Short)
+    return sin_wave
 
 
 def read_files_serial(file_paths: List[str]) -> None:
@@ -51,8 +110,7 @@ def read_files_serial(file_paths: List[str]) -> None:
     Args:
         file_paths: The file paths to read from.
     """
-    for file_path in file_paths:
-        read_file(file_path)
+    deque(map(read_file, file_paths), maxlen=0)
 
 
 class BenchMark:
@@ -176,18 +234,14 @@ class BenchMark:
         total_read_times = np.empty((x_length, y_length))
         reads_per_second = np.empty((x_length, y_length))
 
+        # the waveforms are all created before any timing starts
+        sin_waves = {
+            buffer_length: create_sin_wave(buffer_length) for buffer_length in curve_lengths
+        }
+
         with tempfile.TemporaryDirectory() as waveform_directory:
             for length_index, buffer_length in enumerate(curve_lengths):
-                x_points = np.linspace(0, 1, buffer_length)
-                sin_data: NDArray[np.float64] = np.sin(2 * np.pi * x_points)
-
-                sin_wave = AnalogWaveform()
-                sin_wave.y_axis_values = sin_data
-                sin_wave.y_axis_extent_magnitude = 0.1
-                sin_wave.y_axis_offset = 0.0
-                sin_wave.x_axis_spacing = 1.0e-7
-
-                sin_wave.measured_data = RawSample(sin_wave.y_axis_values, as_type=Short)
+                sin_wave = sin_waves[buffer_length]
 
                 for count_index, count in enumerate(file_counts):
                     file_names = [
@@ -217,10 +271,9 @@ class BenchMark:
                         f"Curve Length: {buffer_length} "
                         f"time: {time_summation} file_per_second: {count / time_summation}",
                     )
-                    print(
-                        f"Verify number of files in directory: "
-                        f"{len(os.listdir(waveform_directory))}"
-                    )
+                    with os.scandir(waveform_directory) as directory_entries:
+                        file_count = sum(1 for _ in directory_entries)
+                    print(f"Verify number of files in directory: {file_count}")
                     print(
                         f"Verify datum length with one waveform: "
                         f"{np.shape(sin_wave.y_axis_values)[0]}",
@@ -254,12 +307,14 @@ class BenchMark:
 def run_benchmark():
     """Run the benchmark tests for both parallel and serial file read/write methods."""
     benchmark_parallel = BenchMark("Parallel")
-    benchmark_parallel.measure_times(
-        write_method=write_files_in_parallel,
-        read_method=read_files_in_parallel,
-        curve_lengths=[1000, 5000, 10000, 50000],
-        file_counts=[1000, 5000, 10000, 50000],
-    )
+    # one pool is reused for every measurement, so process startup is not part of the timings
+    with multiprocessing.Pool(4) as process_pool:
+        benchmark_parallel.measure_times(
+            write_method=partial(write_files_parallel, process_pool=process_pool),
+            read_method=partial(read_files_in_parallel, process_pool=process_pool),
+            curve_lengths=[1000, 5000, 10000, 50000],
+            file_counts=[1000, 5000, 10000, 50000],
+        )
     benchmark_serial = BenchMark("Serial")
     benchmark_serial.measure_times(
         write_method=write_files_serial,
@@ -267,8 +322,17 @@ def run_benchmark():
         curve_lengths=[1000, 5000, 10000, 50000],
         file_counts=[1000, 5000, 10000, 50000],
     )
+    # copying the written file skips formatting the waveform for every file, so it is measured
+    # separately rather than being compared against the other write methods
+    benchmark_copied = BenchMark("Copied")
+    benchmark_copied.measure_times(
+        write_method=write_files_copied,
+        read_method=read_files_serial,
+        curve_lengths=[1000, 5000, 10000, 50000],
+        file_counts=[1000, 5000, 10000, 50000],
+    )
 
-    for benchmark in benchmark_serial, benchmark_parallel:
+    for benchmark in benchmark_serial, benchmark_parallel, benchmark_copied:
         for key, item in asdict(benchmark.results).items():
             np.savetxt(
                 f"temp_{benchmark.name}_{key}.txt",
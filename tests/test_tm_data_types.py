@@ -1,5 +1,10 @@
 """Tests for tm_data_types."""
 
+import io
+import itertools
+import math
+import multiprocessing
+import sys
 import timeit
 
 from pathlib import Path
@@ -8,19 +13,29 @@ from typing import List, Type, TYPE_CHECKING
 import numpy as np
 import pytest
 
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+
 from tm_data_types import FileExtensions
 from tm_data_types.datum.data_types import RawSample, type_max, type_min
 from tm_data_types.datum.waveforms.analog_waveform import AnalogWaveform
 from tm_data_types.datum.waveforms.digital_waveform import (
     DigitalWaveform,
 )
-from tm_data_types.datum.waveforms.iq_waveform import IQWaveform
-from tm_data_types.datum.waveforms.waveform import Waveform, WaveformMetaInfo
+from tm_data_types.datum.waveforms.iq_waveform import IQWaveform, IQWaveformMetaInfo
+from tm_data_types.datum.waveforms.waveform import (
+    ExclusiveMetaInfo,
+    Waveform,
+    WaveformMetaInfo,
+)
 from tm_data_types.files_and_formats.wfm.data_formats.analog import (
     AnalogWaveformMetaInfo,
     WaveformFileWFMAnalog,
 )
 from tm_data_types.files_and_formats.wfm.data_formats.iq import WaveformFileWFMIQ
+from tm_data_types.files_and_formats.wfm.wfm import WFMFile
+from tm_data_types.files_and_formats.wfm.wfm_data_classes import ExplicitDimensions
+from tm_data_types.files_and_formats.wfm.wfm_format import calculate_checksum, WfmFormat
+from tm_data_types.helpers.byte_data_class import EnforcedTypeDataClass
 from tm_data_types.helpers.byte_data_types import (
     ByteData,
     Char,
@@ -29,22 +44,41 @@ from tm_data_types.helpers.byte_data_types import (
     Long,
     LongLong,
     Short,
+    String8,
     UnsignedChar,
     UnsignedLong,
     UnsignedLongLong,
     UnsignedShort,
 )
 from tm_data_types.io_factory_methods import (
+    iread_files_in_parallel,
     read_file,
     read_files_in_parallel,
     write_file,
     write_files_in_parallel,
+    write_same_file,
+    write_same_file_in_parallel,
 )
 
 if TYPE_CHECKING:
     from numpy.typing import DTypeLike
 
 
+# the saved waveforms used by the tests
+_WAVEFORM_DIR = Path(__file__).parent / "waveforms"
+_INVALID_WAVEFORM_DIR = _WAVEFORM_DIR / "invalid_waveforms"
+# the file extensions each waveform type can be saved and loaded as
+_ANALOG_EXTENSIONS = [
+    FileExtensions.CSV.value,
+    FileExtensions.WFM.value,
+    FileExtensions.MAT.value,
+]
+_DIGITAL_EXTENSIONS = [
+    FileExtensions.WFM.value,
+    FileExtensions.CSV.value,
+]
+
+
 def test_serial(tmp_path: Path) -> None:
     """Check to make sure that a serial write can write a waveform and read the same waveform."""
     waveform_path = tmp_path / "test_serial.wfm"
@@ -72,13 +106,14 @@ def test_parallel(tmp_path: Path) -> None:
     waveform_info = {}
     file_count = 10
 
+    # each row holds the waveform data for one file
+    waveform_data = np.outer(np.arange(file_count), np.arange(10)).astype(np.int16)
+
     for index in range(file_count):
         waveform_path = tmp_path / f"test_parallel_{index}.wfm"
 
-        waveform_data = np.array([index * locale for locale in range(10)], np.int16)
-
         waveform = AnalogWaveform()
-        waveform.y_axis_values = waveform_data
+        waveform.y_axis_values = waveform_data[index]
         waveform.meta_info = AnalogWaveformMetaInfo(
             y_offset=0.0,
             y_position=0.0,
@@ -93,6 +128,85 @@ def test_parallel(tmp_path: Path) -> None:
     else:
         raise IOError("No Files written/read.")
 
+    read_paths = []
+    for file_path, waveform in iread_files_in_parallel(list(waveform_info.keys())):
+        assert np.array_equal(waveform.y_axis_values, waveform_info[file_path].y_axis_values)
+        read_paths.append(file_path)
+    assert sorted(read_paths) == sorted(waveform_info)
+
+
+def test_parallel_same_waveform(tmp_path: Path) -> None:
+    """Check to make sure that the same waveform can be written to many files in parallel."""
+    waveform = AnalogWaveform()
+    waveform.y_axis_values = np.array([1, 2, 3, 4], np.int16)
+    waveform_paths = [(tmp_path / f"test_same_{index}.wfm").as_posix() for index in range(6)]
+
+    write_same_file_in_parallel(waveform_paths, waveform)
+
+    for waveform_path in waveform_paths:
+        assert np.array_equal(read_file(waveform_path).y_axis_values, waveform.y_axis_values)
+
+    # no files to write is not an error
+    write_same_file_in_parallel([], waveform)
+
+
+def test_same_waveform(tmp_path: Path) -> None:
+    """Check to make sure that the same waveform can be written to many files of each extension."""
+    waveform = AnalogWaveform()
+    waveform.y_axis_values = np.array([1, 2, 3, 4], np.int16)
+    waveform.trigger_index = 0.0
+    waveform_paths = [
+        (tmp_path / f"test_same_{index}.{extension}").as_posix()
+        for extension in ("wfm", "csv")
+        for index in range(3)
+    ]
+
+    write_same_file(waveform_paths, waveform)
+
+    for waveform_path in waveform_paths:
+        assert np.allclose(
+            read_file(waveform_path).normalized_vertical_values,
+            waveform.normalized_vertical_values,
+            atol=0.0005,
+        )
+
+
+def test_same_waveform_repeated_path(tmp_path: Path) -> None:
+    """Check that the same waveform can be written when a file path is repeated."""
+    waveform = AnalogWaveform()
+    waveform.y_axis_values = np.array([1, 2, 3, 4], np.int16)
+    waveform_path = tmp_path / "test_repeated.wfm"
+    aliased_path = tmp_path / "." / "test_repeated.wfm"
+    other_path = tmp_path / "test_other.wfm"
+    waveform_paths = [waveform_path, other_path, waveform_path, aliased_path, other_path]
+
+    write_same_file([path.as_posix() for path in waveform_paths], waveform)
+
+    for path in (waveform_path, other_path):
+        assert np.array_equal(read_file(path.as_posix()).y_axis_values, waveform.y_axis_values)
+
+
+def test_parallel_existing_pool(tmp_path: Path) -> None:
+    """Check that the parallel methods can share a process pool that is already running."""
+    waveform = AnalogWaveform()
+    waveform.y_axis_values = np.array([5, 6, 7, 8], np.int16)
+    waveform_paths = [(tmp_path / f"test_pool_{index}.wfm").as_posix() for index in range(6)]
+
+    # the number of processes in the provided pool sets how the files are chunked
+    with multiprocessing.Pool(2) as pool:
+        write_same_file_in_parallel(waveform_paths, waveform, 2, process_pool=pool)
+        waveforms = [waveform] * len(waveform_paths)
+        write_files_in_parallel(waveform_paths, waveforms, 2, process_pool=pool)
+        read_info = read_files_in_parallel(waveform_paths, 2, process_pool=pool)
+        # no files to write or read is not an error
+        write_same_file_in_parallel([], waveform, 2, process_pool=pool)
+        write_files_in_parallel([], [], 2, process_pool=pool)
+        assert read_files_in_parallel([], 2, process_pool=pool) == []
+
+    assert sorted(file_path for file_path, _ in read_info) == sorted(waveform_paths)
+    for _, read_waveform in read_info:
+        assert np.array_equal(read_waveform.y_axis_values, waveform.y_axis_values)
+
 
 @pytest.mark.parametrize(
     ("waveform_type", "waveform_meta_info"),
@@ -105,7 +219,7 @@ def test_wfm(
     waveform = waveform_type()
     waveform.meta_info = waveform_meta_info()
     format_name = f"golden_{waveform}.wfm"
-    waveform_dir = f"{Path(__file__).parent}/waveforms"
+    waveform_dir = _WAVEFORM_DIR.as_posix()
     golden_path = f"{waveform_dir}/{format_name}"
 
     waveform_path = tmp_path / "test_format.wfm"
@@ -116,13 +230,32 @@ def test_wfm(
     waveform.y_axis_spacing = 1 / type_max(np.dtype(np.int16))
     write_file(waveform_path.as_posix(), waveform)
 
-    with open(waveform_path, "rb+") as wfm:
-        raw_test_data = wfm.read()
+    assert waveform_path.read_bytes() == Path(golden_path).read_bytes()
+
 
-    with open(golden_path, "rb+") as wfm:
-        golden_format_data = wfm.read()
+def are_multiples(
+    first_values: np.ndarray,
+    second_values: np.ndarray,
+    with_offset: bool = False,
+) -> bool:
+    """Check if one set of values is a multiple of the other.
 
-    assert raw_test_data == golden_format_data
+    The gram matrix of both sets is found in one pass, then the Cauchy-Schwarz inequality is
+    checked for equality. The tolerance only allows for the rounding of the values to integers.
+
+    Args:
+        first_values: The first set of values.
+        second_values: The second set of values.
+        with_offset: Whether the values can also be offset from each other, as formats which don't
+            store the range of the values spread them across the full range of the type.
+    """
+    # the products are found in float64, as np.dot on int16 values wraps around on overflow, so
+    # an exact equality of the wrapped products can pass or fail regardless of the values
+    stacked_values = np.vstack((first_values, second_values)).astype(np.float64)
+    if with_offset:
+        stacked_values -= stacked_values.mean(axis=1, keepdims=True)
+    gram = stacked_values @ stacked_values.T
+    return gram[0, 1] >= 0 and math.isclose(gram[0, 1] ** 2, gram[0, 0] * gram[1, 1], rel_tol=1e-9)
 
 
 def read_write_read(
@@ -139,16 +272,15 @@ def read_write_read(
         waveform_path: The path of a saved waveform.
         temp_path: The path of a temporarily saved waveform.
     """
+    # only .wfm files store the range of the values, the other formats scale and offset them
+    waveform_has_range = waveform_path.endswith(".wfm")
+    temp_has_range = temp_path.endswith(".wfm")
     read_wfm: Waveform = read_file(waveform_path)
     read_wfm_values = getattr(read_wfm, vertical_data)
     loaded_data = np.load(data_path)
     # needs to be a multiple as .csv files don't know what the actual range of the values are
     # so we check to see if each value is fractionally the same
-    waveforms_are_multiple = np.dot(read_wfm_values, loaded_data) * np.dot(
-        read_wfm_values,
-        loaded_data,
-    ) == np.dot(read_wfm_values, read_wfm_values) * np.dot(loaded_data, loaded_data)
-    assert waveforms_are_multiple
+    assert are_multiples(read_wfm_values, loaded_data, with_offset=not waveform_has_range)
 
     write_file(temp_path, read_wfm)
 
@@ -171,39 +303,34 @@ def read_write_read(
     if waveform_path.split(".")[-1] == temp_path.split(".")[-1]:
         assert np.array_equal(getattr(re_read_waveform, vertical_data), read_wfm_values)
     else:
-        re_read_values = getattr(re_read_waveform, vertical_data)
-        assert np.dot(re_read_values, read_wfm_values) * np.dot(
-            re_read_values,
+        assert are_multiples(
+            getattr(re_read_waveform, vertical_data),
             read_wfm_values,
-        ) == np.dot(re_read_values, re_read_values) * np.dot(read_wfm_values, read_wfm_values)
+            with_offset=not (waveform_has_range and temp_has_range),
+        )
 
 
-def test_analog(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ("known_extension", "temporary_extension"),
+    list(itertools.product(_ANALOG_EXTENSIONS, repeat=2)),
+)
+def test_analog(known_extension: str, temporary_extension: str, tmp_path: Path) -> None:
     """Test to see if analog waveforms will return the same data when saved and loaded."""
     waveform_data = "analog_data.npy"
     waveform_name = "analog_waveform."
-    waveform_dir = f"{Path(__file__).parent}/waveforms"
+    waveform_dir = _WAVEFORM_DIR.as_posix()
 
     waveform_path = f"{waveform_dir}/{waveform_name}"
     data_path = f"{waveform_dir}/{waveform_data}"
 
-    extensions = [
-        FileExtensions.CSV.value,
-        FileExtensions.WFM.value,
-        FileExtensions.MAT.value,
-    ]
-    for known_extension in extensions:
-        for temporary_extension in extensions:
-            temp_waveform = (
-                f"test_analog_{known_extension}_to_{temporary_extension}.{temporary_extension}"
-            )
-            temporary_path = tmp_path / temp_waveform
-            read_write_read(
-                "y_axis_values",
-                waveform_path + known_extension,
-                data_path,
-                temporary_path.as_posix(),
-            )
+    temp_waveform = f"test_analog_{known_extension}_to_{temporary_extension}.{temporary_extension}"
+    temporary_path = tmp_path / temp_waveform
+    read_write_read(
+        "y_axis_values",
+        waveform_path + known_extension,
+        data_path,
+        temporary_path.as_posix(),
+    )
 
 
 def test_iq(tmp_path: Path) -> None:
@@ -211,7 +338,7 @@ def test_iq(tmp_path: Path) -> None:
     temp_waveform = "test_iq."
     waveform_data = "iq_data.npy"
     waveform_name = "iq_waveform."
-    waveform_dir = f"{Path(__file__).parent}/waveforms"
+    waveform_dir = _WAVEFORM_DIR.as_posix()
     waveform_path = f"{waveform_dir}/{waveform_name}"
     data_path = f"{waveform_dir}/{waveform_data}"
 
@@ -231,38 +358,39 @@ def test_iq(tmp_path: Path) -> None:
         )
 
 
-def test_digital(tmp_path: Path) -> None:
+@pytest.mark.parametrize(
+    ("known_extension", "temporary_extension"),
+    list(itertools.product(_DIGITAL_EXTENSIONS, repeat=2)),
+)
+def test_digital(known_extension: str, temporary_extension: str, tmp_path: Path) -> None:
     """Test to see if digital waveforms will return the same data when saved and loaded."""
     waveform_data = "digital_data.npy"
     waveform_name = "digital_waveform."
-    waveform_dir = f"{Path(__file__).parent}/waveforms"
+    waveform_dir = _WAVEFORM_DIR.as_posix()
     waveform_path = f"{waveform_dir}/{waveform_name}"
     data_path = f"{waveform_dir}/{waveform_data}"
-    extensions = [
-        FileExtensions.WFM.value,
-        FileExtensions.CSV.value,
-    ]
-    for known_extension in extensions:
-        for temporary_extension in extensions:
-            temp_waveform = (
-                f"test_digital_{known_extension}_to_{temporary_extension}.{temporary_extension}"
-            )
-            temporary_path = tmp_path / temp_waveform
-            read_write_read(
-                "y_axis_byte_values",
-                waveform_path + known_extension,
-                data_path,
-                temporary_path.as_posix(),
-            )
+
+    temp_waveform = f"test_digital_{known_extension}_to_{temporary_extension}.{temporary_extension}"
+    temporary_path = tmp_path / temp_waveform
+    read_write_read(
+        "y_axis_byte_values",
+        waveform_path + known_extension,
+        data_path,
+        temporary_path.as_posix(),
+    )
 
 
 def test_data():  # pylint: disable=too-many-locals
     """Test if normalized data is correctly represented, and that data types can be converted."""
     waveform_name = "data_test_waveform.wfm"
-    waveform_dir = f"{Path(__file__).parent}/waveforms"
+    waveform_dir = _WAVEFORM_DIR.as_posix()
     waveform_path = f"{waveform_dir}/{waveform_name}"
 
     dtypes = [np.float32, np.int8, np.int16, np.int32, np.uint8, np.uint32, np.uint64]
+    is_unsigned = {dtype: np.issubdtype(dtype, np.unsignedinteger) for dtype in dtypes}
+    # the normalized values expected after converting to an unsigned or signed type
+    expected_unsigned_output = np.array([0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19])
+    expected_signed_output = np.array([0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14])
     to_test_values = np.array([-4, -3, -2, -1, 0, 1, 2, 3, 4])
     extent_magnitude = 0.1
     offset = 0.1
@@ -271,10 +399,7 @@ def test_data():  # pylint: disable=too-many-locals
         type_extent_min = type_min(np.dtype(dtype))
         # create a value array from -5 to 5 as a np.int16,
         # then scale it to the extent of a 16 bit integer
-        if np.issubdtype(dtype, np.unsignedinteger):
-            to_test_values_updated = to_test_values + 5
-        else:
-            to_test_values_updated = to_test_values
+        to_test_values_updated = to_test_values + 5 if is_unsigned[dtype] else to_test_values
         values_high = to_test_values_updated * (type_extent_max / 10)
         values_low = to_test_values_updated * (type_extent_min / 10)
 
@@ -290,38 +415,27 @@ def test_data():  # pylint: disable=too-many-locals
         assert np.array_equal(actual_output, expected_output)
         for converted_dtype in dtypes:
             waveform_copy = waveform.transform_to_type(converted_dtype)
-            if not np.issubdtype(dtype, np.unsignedinteger) and np.issubdtype(
-                converted_dtype,
-                np.unsignedinteger,
-            ):
+            if not is_unsigned[dtype] and is_unsigned[converted_dtype]:
                 test_output = actual_output + (extent_magnitude / 2)
-            elif np.issubdtype(dtype, np.unsignedinteger) and not np.issubdtype(
-                converted_dtype,
-                np.unsignedinteger,
-            ):
+            elif is_unsigned[dtype] and not is_unsigned[converted_dtype]:
                 test_output = actual_output - (extent_magnitude / 2)
             else:
                 test_output = actual_output
 
-            if np.issubdtype(converted_dtype, np.unsignedinteger):
-                literal_comparisons = np.isclose(
-                    [0.11, 0.12, 0.13, 0.14, 0.15, 0.16, 0.17, 0.18, 0.19],
-                    waveform_copy.normalized_vertical_values,
-                    atol=0.002,
-                )
+            if is_unsigned[converted_dtype]:
+                literal_output = expected_unsigned_output
             else:
-                literal_comparisons = np.isclose(
-                    [0.06, 0.07, 0.08, 0.09, 0.1, 0.11, 0.12, 0.13, 0.14],
-                    waveform_copy.normalized_vertical_values,
-                    atol=0.002,
-                )
-            value_comparisons = np.isclose(
-                test_output,
+                literal_output = expected_signed_output
+            np.testing.assert_allclose(
                 waveform_copy.normalized_vertical_values,
+                literal_output,
+                atol=0.002,
+            )
+            np.testing.assert_allclose(
+                waveform_copy.normalized_vertical_values,
+                test_output,
                 atol=0.0005,
             )
-            assert all(literal_comparisons)
-            assert all(value_comparisons)
 
     # read a sin wave in from a TEKSCOPE with offset 0 and amplitude 0.5
     with WaveformFileWFMAnalog(waveform_path, "rb+") as wfm:
@@ -342,8 +456,7 @@ def test_data():  # pylint: disable=too-many-locals
     )
 
     # check if they are close with 7mV degree of error
-    value_comparisons = np.isclose(sin_wave, read_waveform.normalized_vertical_values, atol=0.011)
-    assert all(value_comparisons)
+    np.testing.assert_allclose(read_waveform.normalized_vertical_values, sin_wave, atol=0.011)
 
 
 def test_properties():
@@ -454,17 +567,134 @@ def test_types():
         np.float32,
         np.float64,
     ]
-    byte_arrays = []
-    np_arrays = []
     for data in data_types:
-        for data_byte in data_byte_types:
-            byte_arrays.append(RawSample(data, as_type=data_byte))  # noqa: PERF401
+        for data_byte, np_type in zip(data_byte_types, np_types):
+            byte_array = RawSample(data, as_type=data_byte)
+            np_array = RawSample(data, as_type=np_type)
+            assert np_array.dtype == byte_array.dtype
 
-        for np_type in np_types:
-            np_arrays.append(RawSample(data, as_type=np_type))  # noqa: PERF401
 
-        for np_array, byte_array in zip(np_arrays, byte_arrays):
-            assert np_array.dtype == byte_array.dtype
+def test_strings():
+    """Test the conversions used when creating a string datum."""
+    assert String8(5) == b"\x00\x00\x00\x00\x00\x00\x00\x05"
+    assert String8("abc") == b"abc\x00\x00\x00\x00\x00"
+    assert str(String8("abc")) == "abc"
+    # non ascii characters are padded by their encoded length
+    assert String8("\u00e9") == b"\xc3\xa9\x00\x00\x00\x00\x00\x00"
+    assert str(String8("\u00e9")) == "\u00e9"
+    # byte values are kept as they are
+    assert String8(b"abc") == b"abc"
+    assert isinstance(String8(b"abc"), String8)
+
+
+def test_enforced_types():
+    """Test the type casting of the enforced type dataclasses."""
+
+    @pydantic_dataclass
+    class ParentInfo(EnforcedTypeDataClass):
+        count: int = 0
+
+    @pydantic_dataclass
+    class ChildInfo(ParentInfo):
+        scale: float = 1.0
+
+    # the fields of the child class don't change how the parent class is created
+    parent_info = ParentInfo(count="3")
+    assert parent_info.count == 3
+    assert isinstance(parent_info.count, int)
+    assert not hasattr(parent_info, "scale")
+    child_info = ChildInfo(count="4", scale="2")
+    assert child_info.count == 4
+    assert isinstance(child_info.count, int)
+    assert child_info.scale == 2.0
+    assert isinstance(child_info.scale, float)
+    with pytest.raises(TypeError, match=r"cannot be converted to type"):
+        ChildInfo(count="not a number")
+
+    meta_info = AnalogWaveformMetaInfo(y_offset="6", real_data_start_index=None)
+    assert meta_info.y_offset == 6.0
+    assert isinstance(meta_info.y_offset, float)
+    assert meta_info.real_data_start_index is None
+    with pytest.raises(TypeError, match=r"cannot be converted to type"):
+        AnalogWaveformMetaInfo(y_offset="not a number")
+
+
+def test_enforced_defaults():
+    """Test the defaults used when a field of an enforced type dataclass is not provided."""
+
+    @pydantic_dataclass
+    class ParentInfo(EnforcedTypeDataClass):
+        required: int = "no_default"  # pyright: ignore [reportAssignmentType]
+        scale: float = 1.0
+
+    @pydantic_dataclass
+    class ChildInfo(ParentInfo):
+        scale: int = 2
+
+    with pytest.raises(TypeError, match=r"__init__ missing 1 required argument: required"):
+        ParentInfo()
+    assert ParentInfo(required="3").required == 3
+    assert ParentInfo(required=3).scale == 1.0
+    # the default and type of the child class are used over those of the parent class
+    assert ChildInfo(required=3).scale == 2
+    assert isinstance(ChildInfo(required=3, scale="4").scale, int)
+    # only a missing value is checked against the "no_default" default, not a provided value
+    assert ExclusiveMetaInfo(waveform_label="no_default").waveform_label == "no_default"
+
+    # fields with a default factory have no class level default, so they must be provided
+    with pytest.raises(TypeError, match=r"__init__ missing 1 required argument"):
+        IQWaveformMetaInfo()
+    iq_meta_info = IQWaveformMetaInfo(
+        iq_center_frequency="1",
+        iq_fft_length=2,
+        iq_resolution_bandwidth=3,
+        iq_span=4,
+        iq_window_type="Blackharris",
+    )
+    assert iq_meta_info.iq_center_frequency == 1.0
+
+
+def test_tekmeta():
+    """Test that the metadata at the end of a wfm file can be written and read back."""
+    meta_data = {"label": "Kanal \u00b51 \u2013 \u03b1", "\u00e9tat": 3, "scale": 1.5}
+    for endian in WFMFile._ENDIAN_PREFIX_LOOKUP.values():  # noqa: SLF001
+        formatted_data = WfmFormat()
+        formatted_data.meta_data = meta_data
+        filestream = io.BytesIO()
+        formatted_data._write_tekmeta(endian, filestream)  # noqa: SLF001
+        filestream.seek(0)
+        # non ascii strings are written with their full encoded length
+        assert WfmFormat.parse_tekmeta(endian, filestream) == {
+            "label": meta_data["label"].encode("utf_8"),
+            "\u00e9tat": 3,
+            "scale": 1.5,
+        }
+
+
+def test_structured_unpack():
+    """Test that unpacking structured information matches constructing it from the values."""
+    packer = ExplicitDimensions._get_struct("<")  # noqa: SLF001
+    info = [
+        b"V" if isinstance(value, bytes) else value for value in packer.unpack(bytes(packer.size))
+    ]
+    expected = ExplicitDimensions(**dict(zip(ExplicitDimensions._field_names, info)))  # noqa: SLF001
+    filestream = io.BytesIO()
+    expected.pack("<", filestream)
+    filestream.seek(0)
+    unpacked = ExplicitDimensions.unpack("<", filestream, in_order=True)
+    assert unpacked == expected
+    for field_name in ExplicitDimensions.__annotations__:
+        assert type(getattr(unpacked, field_name)) is type(getattr(expected, field_name))
+
+
+def test_checksum():
+    """Test the numba byte checksum against the numpy byte summation."""
+    generator = np.random.default_rng(0)
+    for dtype in (np.int8, np.uint8, np.int16, np.int32, np.uint32, np.int64, np.float64):
+        values = generator.integers(-100, 100, size=10_001).astype(dtype)
+        expected = int(np.add.reduce(values.view(np.uint8), dtype=np.uint64))
+        assert int(calculate_checksum(values)) == expected
+    assert int(calculate_checksum(np.array([], dtype=np.int16))) == 0
 
 
 def transformation_types(waveform: AnalogWaveform) -> List[AnalogWaveform]:
@@ -501,76 +731,83 @@ def test_transforms(tmp_path: Path) -> None:
     values = np.array([41, 42, 43, 124, 125, 126], dtype=np.int8)
     waveform = AnalogWaveform()
     waveform.meta_info = AnalogWaveformMetaInfo()
-    waveform.y_axis_values = values.copy()
+    waveform.y_axis_values = values
     waveform.y_axis_spacing = 1 / type_max(np.dtype(np.int8))
     waveform.trigger_index = 3.0
 
-    for waveform_to_convert in transformation_types(waveform):
-        for converted_waveform in transformation_types(waveform_to_convert):
-            with WaveformFileWFMAnalog(waveform_path.as_posix(), "wb+") as wfm:
+    # the same file is rewritten for every transformation, so it only needs to be opened once
+    with WaveformFileWFMAnalog(waveform_path.as_posix(), "wb+") as wfm:
+        for waveform_to_convert in transformation_types(waveform):
+            for converted_waveform in transformation_types(waveform_to_convert):
+                wfm.fd.seek(0)
+                wfm.fd.truncate()
                 wfm.write_datum(converted_waveform)
 
-            with WaveformFileWFMAnalog(waveform_path.as_posix(), "rb+") as wfm:
+                wfm.fd.seek(0)
                 read_waveform = wfm.read_datum()
-            waveforms_to_compare = [
-                waveform,
-                waveform_to_convert,
-                converted_waveform,
-                read_waveform,
-            ]
-            for comparer_waveform in waveforms_to_compare:
-                for comparee_waveform in waveforms_to_compare:
-                    value_comparisons = np.isclose(
-                        comparer_waveform.normalized_vertical_values,
-                        comparee_waveform.normalized_vertical_values,
-                        atol=0.0015,
-                    )
-                    assert all(value_comparisons)
-
-
-def test_wfm_size(tmp_path: Path) -> None:
+                waveforms_to_compare = [
+                    waveform,
+                    waveform_to_convert,
+                    converted_waveform,
+                    read_waveform,
+                ]
+                for comparer_waveform in waveforms_to_compare:
+                    for comparee_waveform in waveforms_to_compare:
+                        np.testing.assert_allclose(
+                            comparer_waveform.normalized_vertical_values,
+                            comparee_waveform.normalized_vertical_values,
+                            atol=0.0015,
+                        )
+
+
+@pytest.mark.parametrize(
+    ("si_unit", "length"),
+    [
+        ("10", 10**1),
+        ("100", 10**2),
+        ("1K", 10**3),
+        ("10K", 10**4),
+        ("100K", 10**5),
+        ("1M", 10**6),
+        pytest.param("10M", 10**7, marks=pytest.mark.slow),
+        pytest.param("100M", 10**8, marks=pytest.mark.slow),
+        pytest.param("1G", 10**9, marks=pytest.mark.slow),
+    ],
+)
+def test_wfm_size(si_unit: str, length: int, tmp_path: Path) -> None:
     """Test how different waveform sizes function."""
-    lengths = {
-        "10": 10**1,
-        "100": 10**2,
-        "1K": 10**3,
-        "10K": 10**4,
-        "100K": 10**5,
-        "1M": 10**6,
-        "10M": 10**7,
-        "100M": 10**8,
-        "1G": 10**9,
-    }
-    for si_unit, length in lengths.items():
-        waveform_path = tmp_path / f"test_length_{length}.wfm"
-        data = np.linspace(
-            type_min(np.dtype(np.int16)),
-            type_max(np.dtype(np.int16)),
-            length,
-            dtype=np.int16,
-        )
+    # tracing makes the largest sizes take minutes, so they are only run untraced
+    if length >= 10**7 and sys.gettrace() is not None:
+        pytest.skip("Large waveform sizes are skipped while coverage or a debugger is tracing.")
+    waveform_path = tmp_path / f"test_length_{length}.wfm"
+    data = np.linspace(
+        type_min(np.dtype(np.int16)),
+        type_max(np.dtype(np.int16)),
+        length,
+        dtype=np.int16,
+    )
 
-        waveform = AnalogWaveform()
-        # no conversion
-        waveform.y_axis_values = data
+    waveform = AnalogWaveform()
+    # no conversion
+    waveform.y_axis_values = data
 
-        start_time = timeit.default_timer()
-        write_file(waveform_path.as_posix(), waveform)
-        end_time = timeit.default_timer()
-        print(f"Write Time without conversion {si_unit}: {round(end_time - start_time, 4)}")
+    start_time = timeit.default_timer()
+    write_file(waveform_path.as_posix(), waveform)
+    end_time = timeit.default_timer()
+    print(f"Write Time without conversion {si_unit}: {round(end_time - start_time, 4)}")
 
-        start_time = timeit.default_timer()
-        read_waveform: AnalogWaveform = read_file(waveform_path.as_posix())
-        end_time = timeit.default_timer()
+    start_time = timeit.default_timer()
+    read_waveform: AnalogWaveform = read_file(waveform_path.as_posix())
+    end_time = timeit.default_timer()
 
-        print(f"Read Time without conversion {si_unit}: {round(end_time - start_time, 4)}")
+    print(f"Read Time without conversion {si_unit}: {round(end_time - start_time, 4)}")
 
-        assert read_waveform.y_axis_values.shape[0] == waveform.y_axis_values.shape[0]
+    assert read_waveform.y_axis_values.shape[0] == waveform.y_axis_values.shape[0]
 
 
 def test_invalid_inputs():
     """Test waveforms that have invalid values or formats."""
-    waveform_dir = f"{Path(__file__).parent}/waveforms/invalid_waveforms"
+    waveform_dir = _INVALID_WAVEFORM_DIR.as_posix()
     invalid_tekmeta = "invalid_tekmeta.wfm"
     with pytest.raises(
         IOError,